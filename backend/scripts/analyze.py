@@ -0,0 +1,703 @@
+
+# Alert export analysis (ServiceNow/Dynatrace CSV dumps such as Alertas.csv)
+#
+#   python analyze.py --mode {preview,v2,v3,v4,deep} [Alertas.csv]
+#
+# analyze_alerts.py, analyze_alerts_v2/v3/v4.py and analyze_deep.py are thin
+# wrappers that run one mode each. Loading, column detection, scoring,
+# classification and reporting live here so each improvement is made once.
+
+import argparse
+import array
+import collections
+import csv
+import datetime
+import functools
+import itertools
+import operator
+import os
+import re
+import sys
+
+# Optional: pyarrow moves CSV parsing and counting into C++ for large exports
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.compute as pc
+except ImportError:
+    pa_csv = None
+
+# Keys are counted in batches with Counter.update(list), which runs in C
+# (_count_elements). A dict subclass with __missing__ fed by a Python loop
+# was measured at ~2.5x slower than this, so plain Counter is kept.
+BATCH_SIZE = 10000
+ARROW_MIN_BYTES = 16 * 1024 * 1024 # Smaller files stay on the csv module path
+
+# Cell values that carry no information when scoring columns (O(1) lookups)
+PLACEHOLDERS = frozenset(['#N/A', 'Unknown', 'None', '', '0', '1'])
+
+# Digits are masked when building pattern keys (IDs, percentages, IPs)
+DIGIT_TRANS = str.maketrans('0123456789', '##########')
+
+
+# --- Loading -----------------------------------------------------------------
+
+def load_rows(file_path):
+    # Open an export; returns (file, stripped headers, csv.reader positioned
+    # at the first data row). Latin-1 is common for Excel CSVs in Spanish.
+    # Universal newlines stay on: line breaks inside quoted cells reach the
+    # reports as '\n', which is what their display cleanup expects. Blank
+    # lines come through as [] and callers skip them, as DictReader did.
+    f = open(file_path, 'r', encoding='latin-1')
+    reader = csv.reader(f)
+    headers = [h.strip() for h in next(reader, [])]
+    return f, headers, reader
+
+def arrow_table(file_path, n_cols, indexes=None):
+    # Read an export with Arrow's C++ CSV reader, every column as string.
+    # Synthetic column names sidestep duplicate/odd headers; only `indexes`
+    # are decoded when given. Raises pa.ArrowInvalid on ragged rows.
+    # '\r\n' and '\r' inside cells become '\n', as on the csv module path.
+    names = [f'c{i}' for i in range(n_cols)]
+    wanted = names if indexes is None else list(dict.fromkeys(names[i] for i in indexes if i is not None))
+    table = pa_csv.read_csv(
+        file_path,
+        read_options=pa_csv.ReadOptions(encoding='latin-1', column_names=names, skip_rows=1),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(include_columns=wanted, column_types={n: pa.string() for n in wanted}),
+    )
+    columns = [pc.replace_substring_regex(table[n], pattern='\r\n?', replacement='\n') for n in wanted]
+    return pa.table(columns, names=wanted), names
+
+def arrow_counter(values):
+    vc = pc.value_counts(values)
+    return collections.Counter(dict(zip(vc.field('values').to_pylist(), vc.field('counts').to_pylist())))
+
+def use_arrow(file_path):
+    # Callers fall back to the csv module path when arrow_table() raises
+    # pa.ArrowInvalid (e.g. ragged rows), which that path tolerates
+    return pa_csv is not None and os.path.getsize(file_path) >= ARROW_MIN_BYTES
+
+
+# --- Column detection --------------------------------------------------------
+
+# Header rules per mode: role -> predicate over a stripped header name
+V2_COLUMNS = {
+    # Exact (case-insensitive) names for the description
+    'desc': re.compile(r'breve descripción|resumen|description|short description|asunto|título|summary|detalle', re.IGNORECASE).fullmatch,
+    'ci': re.compile(r'elemento|configuration item|^ci$', re.IGNORECASE).search,
+}
+V3_COLUMNS = {
+    'desc': re.compile(r'breve descripcion|resumen|description|short description|asunto|titulo|summary|detalle|elemento', re.IGNORECASE).search,
+}
+DEEP_COLUMNS = {
+    'desc': re.compile(r'descri|detail|summary|título', re.IGNORECASE).search,
+    'ci': re.compile(r'ci|configuration|elemento', re.IGNORECASE).search,
+    'date': re.compile(r'created|fecha|creado|apertura', re.IGNORECASE).search,
+}
+
+def detect_columns(headers, rules):
+    # First header matching each role's rule, or None
+    return {role: next((h for h in headers if match(h)), None) for role, match in rules.items()}
+
+def column_index(headers, col):
+    return headers.index(col) if col else None
+
+def column_values(rows, idx, default=''):
+    # C-level itemgetter over materialized rows. Ragged rows are rare, so the
+    # guarded comprehension only runs when one is actually hit.
+    try:
+        return list(map(operator.itemgetter(idx), rows))
+    except IndexError:
+        return [row[idx] if len(row) > idx else default for row in rows]
+
+
+# --- Column scoring (v4) -----------------------------------------------------
+
+def scan_columns_python(reader, n_cols):
+    # Single streaming pass: accumulate per-column value counts instead of
+    # materializing every row as a dict. Each column keeps one Counter of raw
+    # cells, placeholders included, so first-seen row order (and with it the
+    # tie order of most_common) is the same as counting the rows directly.
+    col_counts = [collections.Counter() for _ in range(n_cols)]
+    total_rows = 0
+
+    # Values are buffered per column and handed to Counter.update() in
+    # batches so the counting loop runs in C rather than via += per cell.
+    batches = [[] for _ in range(n_cols)]
+
+    def flush():
+        for counts, batch in zip(col_counts, batches):
+            if batch:
+                counts.update(batch)
+                batch.clear()
+
+    for row in reader:
+        if not row: continue
+        total_rows += 1
+        # zip() pairs each cell with its column buffer directly and stops
+        # at the header width, with no row slice or index lookups.
+        for batch, v in zip(batches, row):
+            batch.append(v)
+        if total_rows % BATCH_SIZE == 0:
+            flush()
+    flush()
+
+    def column_stats(counts):
+        # Totals over the non-placeholder values, once per distinct value.
+        # Bare placeholders (the common case) are caught before strip().
+        unique_count = total_len = nonempty = 0
+        for v, c in counts.items():
+            if v in PLACEHOLDERS or v.strip() in PLACEHOLDERS: continue
+            unique_count += 1
+            total_len += len(v) * c
+            nonempty += c
+        return unique_count, total_len, nonempty
+
+    def counts_for(i):
+        # Regroup a column by stripped value, keeping first-seen order
+        counts = collections.Counter()
+        for v, c in col_counts[i].items():
+            counts[v.strip()] += c
+        return counts
+
+    stats = [column_stats(counts) for counts in col_counts]
+    return total_rows, stats, counts_for
+
+def scan_columns_arrow(file_path, n_cols):
+    # Same totals as scan_columns_python, computed by Arrow kernels
+    table, names = arrow_table(file_path, n_cols)
+    bad = pa.array(sorted(PLACEHOLDERS))
+
+    stripped_cols = []
+    stats = []
+    for name in names:
+        col = pc.fill_null(table[name], '')
+        stripped = pc.utf8_trim_whitespace(col)
+        valid = col.filter(pc.and_(pc.not_equal(col, ''), pc.invert(pc.is_in(stripped, value_set=bad))))
+        stripped_cols.append(stripped)
+        stats.append((
+            pc.count_distinct(valid).as_py(),
+            pc.sum(pc.utf8_length(valid)).as_py() or 0,
+            len(valid),
+        ))
+
+    def counts_for(i):
+        return arrow_counter(stripped_cols[i])
+
+    return table.num_rows, stats, counts_for
+
+def score_column(unique_count, total_len, valid_count, total_rows):
+    # Score from the per-column totals accumulated while streaming
+    avg_len = total_len / valid_count
+
+    # We prefer columns with significant text but some repetition (alerts repeat)
+    # If unique_count == total_rows, it's probably an ID -> bad for grouping
+    # If unique_count is very low (e.g. 5), it might be status -> bad for specific alert name
+
+    score = (avg_len * 2) - (abs(total_rows - unique_count) * 0.1)
+    if unique_count < 5: score -= 50 # Penalize low cardinality (Status)
+    if unique_count > total_rows * 0.9: score -= 50 # Penalize high cardinality (IDs)
+    return score
+
+def score_columns(stats, total_rows):
+    # Index and score of the best description candidate (None, -1 if none)
+    best_idx = None
+    max_score = -1
+    for i, (unique_count, total_len, nonempty) in enumerate(stats):
+        if not nonempty: continue
+
+        score = score_column(unique_count, total_len, nonempty, total_rows)
+        if score > max_score:
+            max_score = score
+            best_idx = i
+    return best_idx, max_score
+
+
+# --- Pattern scan (deep) -----------------------------------------------------
+
+# Export date formats, precompiled once. Equivalent to the strptime formats
+# "%d/%m/%Y %H:%M[:%S]", "%Y-%m-%d %H:%M:%S" and "%d-%m-%Y"; like %d, a day
+# may be space-padded (' 5').
+DMY_TIME_RE = re.compile(r'(\d{1,2}| \d)/(\d{1,2})/(\d{4})\s+(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?')
+YMD_TIME_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2}| \d)\s+(\d{1,2}):(\d{1,2}):(\d{1,2})')
+DMY_RE = re.compile(r'(\d{1,2}| \d)-(\d{1,2})-(\d{4})')
+
+def parse_date(date_str):
+    # Dispatch on separator/length instead of trying each strptime format
+    if not date_str:
+        return None
+    try:
+        if '/' in date_str:
+            m = DMY_TIME_RE.fullmatch(date_str)
+            if m:
+                d, mo, y, h, mi, sec = m.groups()
+                return datetime.datetime(int(y), int(mo), int(d), int(h), int(mi), int(sec or 0))
+        elif len(date_str) > 10:
+            m = YMD_TIME_RE.fullmatch(date_str)
+            if m:
+                return datetime.datetime(*map(int, m.groups()))
+        else:
+            m = DMY_RE.fullmatch(date_str)
+            if m:
+                d, mo, y = m.groups()
+                return datetime.datetime(int(y), int(mo), int(d))
+    except ValueError:
+        pass
+    return None
+
+def scan_patterns_python(reader, desc_idx, ci_idx, date_idx):
+    # Single streaming pass. Keys are buffered and fed to Counter.update()
+    # in batches, which counts in C instead of one += per row.
+    patterns = collections.Counter()
+    ci_noise = collections.Counter()
+    date_values = collections.Counter()
+    total_rows = 0
+    pattern_batch = []
+    ci_batch = []
+    date_batch = []
+
+    # One C-level itemgetter pulls all three cells; a missing CI/date column
+    # reads the description cell as a stand-in and is dropped at flush time.
+    get = operator.itemgetter(desc_idx, desc_idx if ci_idx is None else ci_idx, desc_idx if date_idx is None else date_idx)
+    width = max(i for i in (desc_idx, ci_idx, date_idx) if i is not None) + 1
+
+    def flush():
+        patterns.update(pattern_batch)
+        if ci_idx is not None:
+            ci_noise.update(map(str.strip, ci_batch))
+        if date_idx is not None:
+            date_values.update(date_batch)
+        pattern_batch.clear()
+        ci_batch.clear()
+        date_batch.clear()
+
+    for row in reader:
+        if not row: continue
+        total_rows += 1
+        if len(row) >= width:
+            raw_desc, ci, date_val = get(row)
+        else:
+            # Ragged row: missing cells fall back to defaults
+            n = len(row)
+            raw_desc = row[desc_idx] if desc_idx < n else ''
+            ci = row[ci_idx] if ci_idx is not None and ci_idx < n else 'Unknown'
+            date_val = row[date_idx] if date_idx is not None and date_idx < n else ''
+
+        # Normalize Description (Remove specific IDs, percentages, IPs)
+        # Cut the first 60 chars and mask digits so "CPU 87% on 10.0.0.1"
+        # and "CPU 92% on 10.0.0.2" land in the same pattern. Only the
+        # short prefix is stripped/translated, never the full text.
+        pattern = raw_desc.lstrip()[:60].rstrip().translate(DIGIT_TRANS)
+
+        pattern_batch.append(pattern)
+        ci_batch.append(ci)
+        date_batch.append(date_val)
+        if len(pattern_batch) >= BATCH_SIZE:
+            flush()
+    flush()
+
+    if ci_idx is None:
+        ci_noise['Unknown'] = total_rows
+    return total_rows, patterns, ci_noise, date_values
+
+def scan_patterns_arrow(file_path, n_cols, desc_idx, ci_idx, date_idx):
+    # Same result as scan_patterns_python; only the needed columns are decoded
+    table, names = arrow_table(file_path, n_cols, (desc_idx, ci_idx, date_idx))
+
+    desc = pc.fill_null(table[names[desc_idx]], '')
+    desc = pc.utf8_rtrim_whitespace(pc.utf8_slice_codeunits(pc.utf8_ltrim_whitespace(desc), 0, 60))
+    patterns = arrow_counter(pc.replace_substring_regex(desc, pattern='[0-9]', replacement='#'))
+
+    if ci_idx is None:
+        ci_noise = collections.Counter({'Unknown': table.num_rows})
+    else:
+        ci_noise = arrow_counter(pc.utf8_trim_whitespace(pc.fill_null(table[names[ci_idx]], '')))
+
+    date_values = collections.Counter()
+    if date_idx is not None:
+        date_values = arrow_counter(pc.fill_null(table[names[date_idx]], ''))
+
+    return table.num_rows, patterns, ci_noise, date_values
+
+def date_histogram(date_values):
+    # Only the range and a month histogram are reported, so keep running
+    # scalars instead of a list of every parsed datetime. The histogram is a
+    # flat int64 array indexed by month number (slot 0 unused).
+    month_counts = array.array('q', [0] * 13)
+    start = end = None
+    for date_val, count in date_values.items():
+        dt = parse_date(date_val)
+        if dt:
+            month_counts[dt.month] += count
+            if start is None or dt < start: start = dt
+            if end is None or dt > end: end = dt
+    return month_counts, start, end
+
+
+# --- Classification ----------------------------------------------------------
+
+# Recommendation cascades per mode: (keywords, recommendation) groups where
+# the first group with a matching keyword wins, plus a default.
+CASCADES = {
+    'v2': ([
+        (('cpu',), "Ajustar umbral de CPU Saturation. Considerar aumentar la ventana de observación (ej. de 3 min a 5 min) para evitar picos transitorios."),
+        (('memory', 'memoria'), "Revisar Memory Usage. Verificar si es Java/Garbage Collection (activar GC metrics) o memoria del SO. Ajustar umbral si es un comportamiento base."),
+        (('disk', 'disco'), "Ajustar Low Disk Space. Cambiar la lógica de % a valor fijo (MB) si son discos grandes, o ignorar particiones temporales."),
+        (('service', 'servicio', 'failure'), "Revisar Failure Rate. Filtrar errores HTTP 404/400 si no son críticos. Usar 'Automated Baselines' en lugar de umbrales fijos."),
+        (('process', 'proceso'), "Process Unavailable. Verificar si el proceso tiene reinicios programados. Definir 'Maintenance Windows' para horarios conocidos."),
+        (('synthetic',), "Synthetic Monitor Failed. Verificar estabilidad de la prueba desde todas las ubicaciones. Si es intermitente, aumentar el conteo de reintentos."),
+    ], "Analizar si es una alerta de 'Availability' o 'Performance'. Si es frecuente y se cierra rápido, aumentar el umbral de tiempo de alerta."),
+    'v3': ([
+        (('cpu',), "CPU Saturation (increase window)"),
+        (('mem',), "Memory usage (GC/OS check)"),
+        (('disk',), "Low Disk Space (use MB, not %)"),
+    ], "Check Frequency/Threshold"),
+    'v4': ([
+        (('cpu',), "Check CPU Saturation / Increase Observation Window"),
+        (('memory',), "Check Memory / GC Metrics"),
+        (('disk',), "Check Disk Space (MB vs %)"),
+        (('service',), "Check Failure Rate / Ignore 404s"),
+        (('synthetic',), "Check Synthetic Stability"),
+        (('process',), "Check Process Availability"),
+    ], ""),
+    'deep': ([
+        (('cpu',), (
+            "  -> TYPE: Infrastructure / Saturation",
+            "  -> ACTION: Increase 'CPU saturation' sliding window.",
+            "  -> CFG: Settings > Anomaly Detection > Hosts > CPU > Threshold 95% for 5 mins (up from 3).",
+        )),
+        (('connection', 'fail', 'timeout'), (
+            "  -> TYPE: Availability / Connectivity",
+            "  -> ACTION: Enable 'Retry on error' in Synthetic/Http Monitors.",
+            "  -> CFG: Extension settings > Advanced > Retry on connection failure (x2).",
+        )),
+        (('disk',), (
+            "  -> TYPE: Resources / Disk",
+            "  -> ACTION: Switch from % to Fixed Value (MB).",
+            "  -> CFG: Disk anomaly rules > Set 'Free space less than' to 2GB (ignore %).",
+        )),
+        (('process',), (
+            "  -> TYPE: Process Availability",
+            "  -> ACTION: Define Maintenance Window or Disable 'Process Unavailable' for non-criticals.",
+        )),
+    ], (
+        "  -> TYPE: General Anomaly",
+        "  -> ACTION: Review automated baselining. If frequent, set static threshold.",
+    )),
+}
+
+def compile_keywords(groups):
+    # All keywords of a cascade in one case-insensitive pattern: a single
+    # scan per name instead of one lower() plus a substring test per keyword.
+    rank = {kw: i for i, (kws, _) in enumerate(groups) for kw in kws}
+    return rank, re.compile('|'.join(sorted(rank, key=len, reverse=True)), re.IGNORECASE)
+
+KEYWORDS = {mode: compile_keywords(groups) for mode, (groups, _) in CASCADES.items()}
+
+# Memoized: each distinct alert name is classified once per mode
+@functools.lru_cache(maxsize=4096)
+def classify(name, mode):
+    groups, default = CASCADES[mode]
+    rank, keyword_re = KEYWORDS[mode]
+    ranks = [rank[m.lower()] for m in keyword_re.findall(name)]
+    return groups[min(ranks)][1] if ranks else default
+
+
+# --- Reporting ---------------------------------------------------------------
+
+def write_lines(lines):
+    # Report rows are buffered and written once instead of one print() each
+    sys.stdout.write("".join(line + "\n" for line in lines))
+
+def run_preview(file_path):
+    print(f"Analyzing {file_path}...")
+
+    if not os.path.exists(file_path):
+        print("File not found.")
+        return
+
+    # Detected columns based on preview: Número,Tipo de tarea,Prioridad...
+    # We need to find the specific column for the Alert Name/Title.
+
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        reader = csv.DictReader(f)
+
+        # Normlize headers to lowercase for easier access
+        headers = [h.strip() for h in reader.fieldnames] if reader.fieldnames else []
+        print(f"Detected Headers: {headers}")
+
+        print("\n--- SAMPLE DATA (First 3 rows) ---")
+        for i, row in enumerate(reader):
+            if i >= 3: break
+            print(f"Row {i+1}: {row}")
+
+def run_v2(file_path):
+    print(f"ANÁLISIS PROFESIONAL DE ALERTAS: {file_path}")
+    print("="*60)
+
+    if not os.path.exists(file_path):
+        print("Error: Archivo no encontrado.")
+        return
+
+    f, headers, reader = load_rows(file_path)
+    with f:
+        print(f"Cabeceras Detectadas: {headers}")
+
+        # Heuristic to find the Description Column (Likely contains the Alert Name)
+        # If not matched by name, we pick the one with the longest text below.
+        # Let's fallback to 'Elemento' for CI.
+        cols = detect_columns(headers, V2_COLUMNS)
+        desc_col, ci_col = cols['desc'], cols['ci']
+
+        print(f"Columna de Descripción (Título): {desc_col or 'NO DETECTADA'}")
+        print(f"Columna de CI (Elemento): {ci_col or 'NO DETECTADA'}")
+
+        alerts = []
+        first = next(filter(None, reader), None) # First non-empty row
+        if first is not None:
+            # If no desc col found, guess it once from the longest value in the first row
+            if not desc_col:
+                # exclude known non-desc columns
+                candidates = {h: v for h, v in zip(headers, first) if h not in ['Número', 'Prioridad', 'Estado', 'Abierto', 'Cerrado']}
+                if candidates:
+                    desc_col = max(candidates, key=lambda k: len(candidates[k]))
+            alerts.append(first)
+
+        alerts.extend(row for row in reader if row)
+
+    # Resolve column positions once; rows are plain lists from here on
+    desc_idx = column_index(headers, desc_col)
+    ci_idx = column_index(headers, ci_col)
+
+    print(f"Total Incidentes Analizados: {len(alerts)}")
+
+    # 1. Top Noisy CIs
+    if ci_col:
+        ci_counts = collections.Counter(column_values(alerts, ci_idx, 'Unknown'))
+        print("\nTOP 10 ELEMENTOS (CIs) MÁS RUIDOSOS:")
+        print(f"{'#':<5} {'CI / Elemento':<50} {'Incidentes':<10}")
+        print("-" * 70)
+        ci_row = "{0:<5} {1:<50} {0:<10}".format
+        write_lines([ci_row(count, str(name)[:48]) for name, count in ci_counts.most_common(10)])
+
+    # 2. Top Alert Titles (Patterns)
+    if desc_col:
+        title_counts = collections.Counter(map(str.strip, column_values(alerts, desc_idx)))
+
+        print("\nTOP 10 MOTIVOS DE ALERTA (PATRONES):")
+        print(f"{'#':<5} {'Patrón de Alerta':<80} {'Frecuencia':<10}")
+        print("-" * 100)
+        title_row = "{0:<5} {1:<80} {0:<10}".format
+        # Rank once; the recommendations below reuse the head of the same list
+        top_titles = title_counts.most_common(10)
+        # Clean up newlines
+        write_lines([title_row(count, str(name).replace('\n', ' ')[:78]) for name, count in top_titles])
+
+        # 3. Recommendations
+        print("\n" + "="*60)
+        print("RECOMENDACIONES DE AFINAMIENTO EN DYNATRACE")
+        print("="*60)
+
+        total = len(alerts)
+        if total > 0:
+            lines = []
+            for name, count in top_titles[:5]:
+                percent = (count / total) * 100
+                lines.append(f"\n[ALERTA]: {name[:100]}...")
+                lines.append(f"  > Impacto: {count} incidentes ({percent:.1f}% del total)")
+
+                # Heuristic Recommendations
+                lines.append(f"  > ACCIÓN: {classify(name, 'v2')}")
+            write_lines(lines)
+
+def run_v3(file_path):
+    print("ANALISIS RAPIDO DE ALERTAS (V3)")
+
+    if not os.path.exists(file_path):
+        print("No file")
+        return
+
+    f, headers, reader = load_rows(file_path)
+    with f:
+        # Heuristic for description
+        desc_col = detect_columns(headers, V3_COLUMNS)['desc']
+
+        first = []
+        if desc_col:
+            desc_idx = headers.index(desc_col)
+        else:
+            # Fallback: check values
+            sample = next(filter(None, reader), None) # First non-empty row
+            if not sample: return
+
+            # Find longest string column
+            desc_idx = max(range(len(sample)), key=lambda i: len(sample[i]))
+            first.append(sample[desc_idx].strip())
+
+        descs = itertools.chain(first, (row[desc_idx].strip() if len(row) > desc_idx else '' for row in reader if row))
+
+        # Count in bounded batches instead of keeping every description
+        counts = collections.Counter()
+        total = 0
+        for batch in iter(lambda: list(itertools.islice(descs, BATCH_SIZE)), []):
+            counts.update(batch)
+            total += len(batch)
+
+    print(f"Total: {total}")
+    print("TOP 5 ALERTAS:")
+    for name, count in counts.most_common(5):
+        percent = (count/total)*100
+        print(f"{count} ({percent:.1f}%) - {name[:60]}")
+
+        print(f"  -> TUNE: {classify(name, 'v3')}")
+
+def run_v4(file_path):
+    print(f"ANALYZING {file_path}")
+
+    if not os.path.exists(file_path):
+        print("No file")
+        return
+
+    f, headers, reader = load_rows(file_path)
+    with f:
+        scanned = None
+        if use_arrow(file_path):
+            try:
+                scanned = scan_columns_arrow(file_path, len(headers))
+            except pa.ArrowInvalid:
+                pass
+        total_rows, stats, counts_for = scanned or scan_columns_python(reader, len(headers))
+
+    best_idx, max_score = score_columns(stats, total_rows)
+    best_col = headers[best_idx] if best_idx is not None else None
+
+    print(f"Best Column Detected: '{best_col}' (Score: {max_score:.2f})")
+
+    if not best_col:
+        print("Could not detect a good description column.")
+        return
+
+    alert_counts = counts_for(best_idx)
+
+    print(f"Total Alerts: {total_rows}")
+    print("TOP 10 COMMON ALERTS:")
+    for name, count in alert_counts.most_common(10):
+         # Skip if empty or bad
+         if not name or name == '#N/A': continue
+
+         print(f"- [{count}] {name[:60]}")
+
+         # Recommendation
+         rec = classify(name, 'v4')
+         if rec: print(f"  -> RECOMMENDATION: {rec}")
+
+def run_deep(file_path):
+    print("=== DYNATRACE DEEP TUNING ANALYSIS ===")
+
+    if not os.path.exists(file_path):
+        print(f"File {file_path} not found.")
+        return
+
+    f, headers, reader = load_rows(file_path)
+    with f:
+        # 1. Column Detection (Heuristic)
+        cols = detect_columns(headers, DEEP_COLUMNS)
+        desc_col, ci_col, date_col = cols['desc'], cols['ci'], cols['date']
+
+        if not desc_col:
+            total_rows = sum(1 for row in reader if row)
+        else:
+            desc_idx = column_index(headers, desc_col)
+            ci_idx = column_index(headers, ci_col)
+            date_idx = column_index(headers, date_col)
+
+            # 2. Pattern Analysis
+            scanned = None
+            if use_arrow(file_path):
+                try:
+                    scanned = scan_patterns_arrow(file_path, len(headers), desc_idx, ci_idx, date_idx)
+                except pa.ArrowInvalid:
+                    pass
+            total_rows, patterns, ci_noise, date_values = scanned or scan_patterns_python(reader, desc_idx, ci_idx, date_idx)
+
+            # Export timestamps repeat heavily, so each distinct string is parsed once
+            month_counts, start, end = date_histogram(date_values)
+
+    print(f"Total Raw Alerts: {total_rows}")
+    print(f"Mappings -> Desc: {desc_col} | CI: {ci_col} | Date: {date_col}")
+
+    if not desc_col:
+        print("CRITICAL: No description column found. Aborting deep analysis.")
+        return
+
+    # 3. High Volume Patterns (False Positive Candidates)
+    print("\n[NOISE PATTERNS - TOP 10]")
+    print(f"{'Count':<8} | {'Influence':<6} | {'Pattern Prefix'}")
+    print("-" * 60)
+    lines = []
+    top10 = patterns.most_common(10)
+    for p, c in top10:
+        if not p: continue
+        influence = (c / total_rows) * 100
+        lines.append(f"{c:<8} | {influence:.1f}%   | {p}")
+    write_lines(lines)
+
+    # 4. Ingesta Scope (Time Analysis)
+    print("\n[INGESTA TIMELINE]")
+    if start:
+        days = (end - start).days
+        print(f"Range: {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')}")
+        print(f"Total Days: {days}")
+
+        # Check Oct/Nov/Dec coverage
+        oct_count = month_counts[10]
+        nov_count = month_counts[11]
+        dec_count = month_counts[12]
+        jan_count = month_counts[1]
+
+        print(f"Volume by Month:")
+        print(f"  - October: {oct_count}")
+        print(f"  - November: {nov_count}")
+        print(f"  - December: {dec_count}")
+        print(f"  - January: {jan_count}")
+    else:
+        print("No parsable dates found to verify 90-day scope.")
+
+    # 5. Strategic Tuning Recommendations
+    print("\n[STRATEGIC TUNING PLAN]")
+
+    # Analyze Top 3 Patterns for specific advice
+    top_patterns = [p[0].lower() for p in top10[:5] if p[0]]
+
+    lines = []
+    for p in top_patterns:
+        lines.append(f"\nTarget Pattern: '{p[:40]}...'")
+        lines.extend(classify(p, 'deep'))
+    write_lines(lines)
+
+
+MODES = {
+    'preview': run_preview,
+    'v2': run_v2,
+    'v3': run_v3,
+    'v4': run_v4,
+    'deep': run_deep,
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze an alert/incident CSV export.")
+    parser.add_argument('--mode', choices=MODES, default='deep', help="analysis to run (default: deep)")
+    parser.add_argument('file', nargs='?', default='Alertas.csv', help="CSV export (default: Alertas.csv)")
+    args = parser.parse_args(argv)
+
+    # Force UTF-8 output for Windows console/redirection
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except AttributeError:
+        pass
+
+    MODES[args.mode](args.file)
+
+if __name__ == "__main__":
+    main()